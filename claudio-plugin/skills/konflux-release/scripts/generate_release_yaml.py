@@ -32,15 +32,50 @@ Arguments:
     --cves-file PATH              Path to CVE list file (optional, for RHSA)
     --grace-period DAYS           Grace period in days (default: 30)
     --output FILE                 Output file (default: stdout)
+    --batch FILE                  Generate many releases from a YAML list of
+                                  job specs in one process (see run_batch)
+    --jobs N                      Worker processes for --batch (default: one
+                                  per CPU; 1 disables the pool)
+    --output-format FORMAT        yaml (default, human-reviewable) or json
+                                  (faster, accepted by kubectl apply)
 """
 
 import argparse
+import functools
 import os
+import re
+import string
 import sys
-import yaml
+import textwrap
+from typing import Optional
 
 
-def load_cves_from_file(cve_file_path):
+@functools.lru_cache(maxsize=None)
+def _yaml():
+    """
+    Import PyYAML on first use and return (yaml, Loader, Dumper).
+
+    Deferring the import keeps --help and argparse errors from paying the
+    PyYAML startup cost. Prefers the libyaml C binding when available -
+    parsing and emitting through the C scanner/emitter is several times
+    faster than the pure-Python implementation, which matters for large
+    release notes templates.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader, CSafeDumper as dumper
+    except ImportError:
+        from yaml import SafeLoader as loader, SafeDumper as dumper
+    return yaml, loader, dumper
+
+
+# One CVE ID per line, surrounding whitespace allowed
+_CVE_RE = re.compile(rb'(?m)^[ \t]*(CVE-\d{4}-\d+)[ \t\r]*$')
+# A line that is neither blank, a comment, nor a well-formed CVE ID
+_CVE_BAD_LINE_RE = re.compile(rb'(?m)^(?![ \t\r]*(?:#|CVE-\d{4}-\d+[ \t\r]*$|$)).*$')
+
+
+def load_cves_from_file(cve_file_path: str) -> list[str]:
     """
     Load CVE list from file.
 
@@ -51,32 +86,50 @@ def load_cves_from_file(cve_file_path):
     - Empty lines ignored
     - Lines starting with # ignored (comments)
 
+    Any other content is an error - a malformed CVE ID must fail the run
+    rather than silently drop out of the release notes.
+
     Args:
         cve_file_path: Path to CVE file
 
     Returns:
         List of CVE IDs
     """
-    cves = []
     try:
-        with open(cve_file_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
-                cves.append(line)
+        # Slurp the whole file and extract with two compiled regex passes
+        # instead of a Python-level line loop - faster for large RHSA lists.
+        with open(cve_file_path, 'rb') as f:
+            data = f.read()
     except FileNotFoundError:
         print(f"Error: CVE file not found: {cve_file_path}", file=sys.stderr)
         sys.exit(1)
 
-    return cves
+    bad = _CVE_BAD_LINE_RE.search(data)
+    if bad:
+        entry = bad.group().strip().decode('utf-8', errors='replace')
+        print(f"Error: Invalid CVE entry in {cve_file_path}: {entry}", file=sys.stderr)
+        sys.exit(1)
 
+    return [cve.decode('ascii') for cve in _CVE_RE.findall(data)]
 
-def load_release_notes_template(template_path):
+
+@functools.lru_cache(maxsize=32)
+def _load_template_cached(template_path: str, mtime_ns: int, size: int) -> dict:
+    """Parse the template YAML, cached on (path, mtime, size)."""
+    yaml, loader, _ = _yaml()
+    with open(template_path) as f:
+        return yaml.load(f, Loader=loader)
+
+
+def load_release_notes_template(template_path: str) -> dict:
     """
     Load release notes template from YAML file.
 
+    Repeat loads of an unchanged file within the same process hit an
+    in-memory cache and skip the YAML parse entirely. Callers must not
+    mutate the returned template (apply_template_substitutions builds a
+    new structure, so the shared object is safe).
+
     Args:
         template_path: Path to template file
 
@@ -85,9 +138,10 @@ def load_release_notes_template(template_path):
 
     Exits on file not found or YAML parsing errors.
     """
+    yaml = _yaml()[0]
     try:
-        with open(template_path) as f:
-            return yaml.safe_load(f)
+        st = os.stat(template_path)
+        return _load_template_cached(template_path, st.st_mtime_ns, st.st_size)
     except FileNotFoundError:
         print(f"Error: Release notes template not found: {template_path}", file=sys.stderr)
         sys.exit(1)
@@ -96,11 +150,123 @@ def load_release_notes_template(template_path):
         sys.exit(1)
 
 
-def apply_template_substitutions(template, version, accelerator):
+# Compiled substitution plans, keyed by id(template). The template object is
+# kept alongside its plan so its id stays valid for the cache lifetime. When
+# the same template is applied repeatedly (e.g. one template across many
+# components), the str.format parsing work is paid only once.
+_template_plans = {}
+
+_FORMATTER = string.Formatter()
+
+# Plan node tags: strings carry a render callable, containers carry their
+# compiled children and are walked iteratively at render time.
+_STR, _LIST, _DICT = range(3)
+
+# The two placeholder fields, matched in a single pass so substituted values
+# are never rescanned (chained str.replace would re-substitute a literal
+# '{accelerator}' inside the version value, which str.format does not)
+_PLACEHOLDER_RE = re.compile(r'\{(version|accelerator)\}')
+
+
+def _compile_value(value) -> tuple:
+    """
+    Pre-compile one template node into a render plan.
+
+    Returns a (constant, node) pair: when ``constant`` is true, ``node`` is
+    the value itself and can be reused as-is; otherwise ``node`` is a tagged
+    plan tuple consumed by ``_render_plan``.
+    """
+    if isinstance(value, str):
+        if '{' not in value:
+            return True, value
+        # Pre-parse the format string once; rendering is then a join over
+        # literals and field lookups with no parser overhead.
+        parts = tuple(_FORMATTER.parse(value))
+
+        if ('{{' not in value and '}}' not in value
+                and all(field in ('version', 'accelerator')
+                        and not spec and not conversion
+                        for _, field, spec, conversion in parts
+                        if field is not None)):
+            # Plain {version}/{accelerator} placeholders - one compiled
+            # regex pass beats any join over parsed parts.
+            def render_plain(subs, value=value):
+                return _PLACEHOLDER_RE.sub(lambda m: subs[m.group(1)], value)
+
+            return False, (_STR, render_plain)
+
+        def render_str(subs, parts=parts):
+            out = []
+            for literal, field, spec, conversion in parts:
+                if literal:
+                    out.append(literal)
+                if field is not None:
+                    obj = subs[field]
+                    if conversion:
+                        obj = _FORMATTER.convert_field(obj, conversion)
+                    out.append(_FORMATTER.format_field(obj, spec or ''))
+            return ''.join(out)
+
+        return False, (_STR, render_str)
+    elif isinstance(value, list):
+        compiled = [_compile_value(item) for item in value]
+        if all(constant for constant, _ in compiled):
+            # No placeholders anywhere below - reuse the subtree as-is
+            return True, value
+        return False, (_LIST, compiled)
+    elif isinstance(value, dict):
+        compiled = [(k, *_compile_value(v)) for k, v in value.items()]
+        if all(constant for _, constant, _ in compiled):
+            return True, value
+        return False, (_DICT, compiled)
+    return True, value
+
+
+def _render_plan(plan: tuple, subs: dict):
+    """
+    Render a non-constant plan node against a substitution dict.
+
+    Containers are walked with an explicit stack rather than recursion: each
+    node's output shell is preallocated and children are filled in place,
+    avoiding a Python frame per nested element.
+    """
+    kind, payload = plan
+    if kind == _STR:
+        return payload(subs)
+    root = [None] * len(payload) if kind == _LIST else {}
+    stack = [(kind, payload, root)]
+    while stack:
+        kind, payload, out = stack.pop()
+        if kind == _LIST:
+            for i, (constant, node) in enumerate(payload):
+                if constant:
+                    out[i] = node
+                elif node[0] == _STR:
+                    out[i] = node[1](subs)
+                else:
+                    shell = [None] * len(node[1]) if node[0] == _LIST else {}
+                    out[i] = shell
+                    stack.append((node[0], node[1], shell))
+        else:
+            for k, constant, node in payload:
+                if constant:
+                    out[k] = node
+                elif node[0] == _STR:
+                    out[k] = node[1](subs)
+                else:
+                    shell = [None] * len(node[1]) if node[0] == _LIST else {}
+                    out[k] = shell
+                    stack.append((node[0], node[1], shell))
+    return root
+
+
+def apply_template_substitutions(template, version: str, accelerator: str):
     """
     Apply version and accelerator substitutions to template.
 
     Replaces {version} and {accelerator} placeholders in all string values.
+    The template is compiled into a render plan on first use and the plan is
+    reused for subsequent applications of the same template object.
 
     Args:
         template: Dict/list/str with template placeholders
@@ -110,21 +276,29 @@ def apply_template_substitutions(template, version, accelerator):
     Returns:
         Template with substitutions applied
     """
-    def substitute(value):
-        if isinstance(value, str):
-            return value.format(version=version, accelerator=accelerator)
-        elif isinstance(value, list):
-            return [substitute(item) for item in value]
-        elif isinstance(value, dict):
-            return {k: substitute(v) for k, v in value.items()}
-        return value
-
-    return substitute(template)
-
-
-def generate_prod_release_yaml(component_name, version, snapshot, release_plan,
-                               release_name, accelerator, namespace, release_notes_template,
-                               release_type, cves_file, grace_period, cve_components=None):
+    key = id(template)
+    entry = _template_plans.get(key)
+    if entry is None or entry[0] is not template:
+        entry = (template, _compile_value(template))
+        _template_plans[key] = entry
+
+    constant, node = entry[1]
+    if constant:
+        # Placeholder-free template: skip the walk entirely. Containers are
+        # shallow-copied because callers add keys (e.g. 'type') to the result.
+        if isinstance(node, dict):
+            return dict(node)
+        if isinstance(node, list):
+            return list(node)
+        return node
+    return _render_plan(node, {'version': version, 'accelerator': accelerator})
+
+
+def generate_prod_release_yaml(component_name: Optional[str], version: str, snapshot: str,
+                               release_plan: str, release_name: str, accelerator: str,
+                               namespace: str, release_notes_template: dict,
+                               release_type: str, cves_file: Optional[str], grace_period: int,
+                               cve_components: Optional[str] = None) -> dict:
     """
     Generate production release YAML.
 
@@ -164,8 +338,15 @@ def generate_prod_release_yaml(component_name, version, snapshot, release_plan,
             components = [component_name]
         else:
             components = []
-        release_notes['cves'] = [{'key': cve_id, 'component': comp}
-                                 for cve_id in cve_ids for comp in components]
+        if len(components) == 1:
+            # Common case: one component, hoisted out of the comprehension so
+            # large RHSA CVE lists build with a single flat loop.
+            comp = components[0]
+            release_notes['cves'] = [{'key': cve_id, 'component': comp}
+                                     for cve_id in cve_ids]
+        else:
+            release_notes['cves'] = [{'key': cve_id, 'component': comp}
+                                     for cve_id in cve_ids for comp in components]
 
     # Build production release YAML
     prod_release = {
@@ -188,7 +369,216 @@ def generate_prod_release_yaml(component_name, version, snapshot, release_plan,
     return prod_release
 
 
-def main():
+# Pre-rendered Release scaffolding: every run emits the same constant keys,
+# so they are kept as a string template and only the releaseNotes subtree
+# goes through the PyYAML emitter.
+_RELEASE_SKELETON = (
+    'apiVersion: appstudio.redhat.com/v1alpha1\n'
+    'kind: Release\n'
+    'metadata:\n'
+    '  name: {name}\n'
+    '  namespace: {namespace}\n'
+    'spec:\n'
+    '  gracePeriodDays: {grace_period}\n'
+    '  releasePlan: {release_plan}\n'
+    '  snapshot: {snapshot}\n'
+    '  data:\n'
+    '    releaseNotes:\n'
+    '{release_notes}'
+)
+
+# Characters allowed in a plain (unquoted) YAML scalar. Passing this regex
+# is not sufficient on its own: strings like 'true', 'null' or '3.5' also
+# need quoting so they stay strings, which _plain_scalar_safe checks via the
+# PyYAML resolver.
+_PLAIN_SCALAR_RE = re.compile(r'^[A-Za-z0-9][A-Za-z0-9._/-]*$')
+
+
+def _plain_scalar_safe(value) -> bool:
+    """
+    Return True if value can be emitted as a plain YAML scalar unchanged.
+
+    Requires a string of safe characters that the YAML resolver would also
+    read back as a string - names like 'true', 'NO', '123' or '3.5' resolve
+    to bool/int/float when unquoted and must take the quoting fallback.
+    """
+    if not isinstance(value, str) or not _PLAIN_SCALAR_RE.match(value):
+        return False
+    yaml = _yaml()[0]
+    tag = yaml.resolver.Resolver().resolve(yaml.nodes.ScalarNode, value,
+                                           (True, False))
+    return tag == 'tag:yaml.org,2002:str'
+
+
+def dump_release_yaml(prod_release: dict, stream, fmt: str = 'yaml') -> None:
+    """
+    Emit a production release dict to the given stream.
+
+    With the default YAML format, the constant Release scaffolding is
+    substituted into a pre-rendered string template, so the PyYAML emitter
+    only runs over the releaseNotes subtree. When a dynamic scalar would
+    not read back as the same string unquoted - rare for Kubernetes
+    resource names - the whole document is dumped normally instead, so
+    output always round-trips. With fmt='json' the release is emitted as
+    indented JSON, which kubectl apply accepts directly.
+    """
+    metadata = prod_release['metadata']
+    spec = prod_release['spec']
+    scalars = (metadata['name'], metadata['namespace'],
+               spec['releasePlan'], spec['snapshot'])
+    if fmt == 'json':
+        # Kubernetes accepts JSON wherever it accepts YAML, and json.dump
+        # skips all of PyYAML's scalar analysis - much faster for pipelines
+        # that feed the output straight to kubectl instead of human review.
+        import json
+        json.dump(prod_release, stream, indent=2)
+        stream.write('\n')
+        return
+
+    yaml, _, dumper = _yaml()
+    if all(_plain_scalar_safe(s) for s in scalars):
+        notes = yaml.dump(spec['data']['releaseNotes'], Dumper=dumper,
+                          default_flow_style=False, sort_keys=False)
+        stream.write(_RELEASE_SKELETON.format(
+            name=metadata['name'],
+            namespace=metadata['namespace'],
+            grace_period=spec['gracePeriodDays'],
+            release_plan=spec['releasePlan'],
+            snapshot=spec['snapshot'],
+            release_notes=textwrap.indent(notes, '      ')))
+    else:
+        yaml.dump(prod_release, stream, Dumper=dumper,
+                  default_flow_style=False, sort_keys=False)
+
+
+# Keys every batch job spec must provide (same names as the CLI flags,
+# with dashes replaced by underscores)
+_BATCH_REQUIRED_KEYS = ('version', 'snapshot', 'release_plan', 'release_name',
+                        'release_notes_template', 'output')
+
+# Keys that must hold strings when present. YAML happily reads an unquoted
+# `version: 3.3` as a float, which would otherwise surface as a TypeError
+# deep inside template rendering instead of a clean validation error.
+_BATCH_STRING_KEYS = _BATCH_REQUIRED_KEYS + ('component', 'accelerator',
+                                             'namespace', 'release_type',
+                                             'cves_file', 'cve_components',
+                                             'output_format')
+
+
+def _render_batch_job(job: dict) -> str:
+    """
+    Generate and write one release YAML from a batch job spec.
+
+    Module-level so it can be dispatched to worker processes; returns the
+    output path for progress reporting in the parent.
+    """
+    template = load_release_notes_template(job['release_notes_template'])
+    prod_release = generate_prod_release_yaml(
+        job.get('component'),
+        job['version'],
+        job['snapshot'],
+        job['release_plan'],
+        job['release_name'],
+        job.get('accelerator', ''),
+        job.get('namespace', 'my-namespace'),
+        template,
+        job.get('release_type', 'RHEA'),
+        job.get('cves_file'),
+        job.get('grace_period', 30),
+        job.get('cve_components')
+    )
+    output = job['output']
+    output_dir = os.path.dirname(output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(output, 'w') as f:
+        dump_release_yaml(prod_release, f, job.get('output_format', 'yaml'))
+    return output
+
+
+def run_batch(batch_path: str, max_workers: Optional[int] = None) -> None:
+    """
+    Generate multiple release YAMLs from a single batch spec file.
+
+    The batch file is a YAML list of job dicts, each using the same keys as
+    the CLI flags (with underscores), for example:
+
+        - version: "3.2.5"
+          snapshot: my-app-78c7f
+          release_plan: my-product-ubi9-prod
+          release_name: my-product-cuda-ubi9-3-2-5-prod-4
+          accelerator: CUDA
+          release_notes_template: /tmp/ga-rhea.yaml
+          output: out/my-product-cuda-ubi9-prod-4.yaml
+
+    Generating a whole release matrix in one process pays interpreter and
+    PyYAML startup once, and the template cache hits across jobs that share
+    a release notes template. Jobs are independent, so larger batches are
+    fanned out across a process pool.
+
+    Args:
+        batch_path: Path to the batch spec file
+        max_workers: Worker processes for the pool (default: one per CPU;
+            1 runs everything in-process)
+
+    Exits on a missing/invalid batch file or an incomplete job spec.
+    """
+    yaml, loader, _ = _yaml()
+    try:
+        with open(batch_path) as f:
+            jobs = yaml.load(f, Loader=loader)
+    except FileNotFoundError:
+        print(f"Error: Batch file not found: {batch_path}", file=sys.stderr)
+        sys.exit(1)
+    except yaml.YAMLError as e:
+        print(f"Error: Invalid YAML in batch file: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if not isinstance(jobs, list) or not all(isinstance(j, dict) for j in jobs):
+        print(f"Error: Batch file must contain a list of job specs: {batch_path}",
+              file=sys.stderr)
+        sys.exit(1)
+
+    # Validate every job before generating anything, so a bad spec late in
+    # the list does not leave a half-written batch behind
+    for i, job in enumerate(jobs):
+        missing = [key for key in _BATCH_REQUIRED_KEYS if not job.get(key)]
+        if missing:
+            print(f"Error: Batch job {i} is missing: {', '.join(missing)}",
+                  file=sys.stderr)
+            sys.exit(1)
+        not_strings = [key for key in _BATCH_STRING_KEYS
+                       if job.get(key) is not None and not isinstance(job[key], str)]
+        if not_strings:
+            print(f"Error: Batch job {i} fields must be strings "
+                  f"(quote them in YAML): {', '.join(not_strings)}",
+                  file=sys.stderr)
+            sys.exit(1)
+        grace_period = job.get('grace_period')
+        if grace_period is not None and (not isinstance(grace_period, int)
+                                         or isinstance(grace_period, bool)):
+            print(f"Error: Batch job {i} grace_period must be an integer",
+                  file=sys.stderr)
+            sys.exit(1)
+        output_format = job.get('output_format')
+        if output_format is not None and output_format not in ('yaml', 'json'):
+            print(f"Error: Batch job {i} output_format must be "
+                  f"'yaml' or 'json', got: {output_format}",
+                  file=sys.stderr)
+            sys.exit(1)
+
+    if len(jobs) > 1 and max_workers != 1:
+        # Each job writes an independent file - fan out across CPU cores.
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for output in executor.map(_render_batch_job, jobs):
+                print(f"Generated: {output}", file=sys.stderr)
+    else:
+        for job in jobs:
+            print(f"Generated: {_render_batch_job(job)}", file=sys.stderr)
+
+
+def main() -> None:
     parser = argparse.ArgumentParser(
         description='Generate Konflux Production Release YAML',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -197,19 +587,19 @@ def main():
 
     parser.add_argument('--component', type=str, default=None,
                        help='Component name (required for RHSA releases with a CVE file)')
-    parser.add_argument('--version', type=str, required=True,
+    parser.add_argument('--version', type=str,
                        help='Semantic version (e.g., 3.2.5)')
-    parser.add_argument('--snapshot', type=str, required=True,
+    parser.add_argument('--snapshot', type=str,
                        help='Snapshot name')
-    parser.add_argument('--release-plan', type=str, required=True,
+    parser.add_argument('--release-plan', type=str,
                        help='Release plan name')
-    parser.add_argument('--release-name', type=str, required=True,
+    parser.add_argument('--release-name', type=str,
                        help='Production release name')
     parser.add_argument('--accelerator', type=str, default='',
                        help='Accelerator/variant type for template substitution (e.g. CUDA, ROCm)')
     parser.add_argument('--namespace', type=str, default='my-namespace',
                        help='Kubernetes namespace (default: my-namespace)')
-    parser.add_argument('--release-notes-template', type=str, required=True,
+    parser.add_argument('--release-notes-template', type=str,
                        help='Path to release notes YAML template (required)')
     parser.add_argument('--release-type', type=str, default='RHEA',
                        choices=['RHEA', 'RHSA'],
@@ -222,9 +612,36 @@ def main():
                        help='Grace period in days (default: 30)')
     parser.add_argument('--output', type=str,
                        help='Output file (default: stdout)')
+    parser.add_argument('--batch', type=str,
+                       help='YAML file with a list of job specs; generates all '
+                            'releases in one process (other arguments ignored)')
+    parser.add_argument('--output-format', type=str, default='yaml',
+                       choices=['yaml', 'json'],
+                       help='Output format; json skips the YAML emitter and '
+                            'is accepted by kubectl apply (default: yaml)')
+    parser.add_argument('--jobs', type=int, default=None,
+                       help='Worker processes for --batch (default: one per '
+                            'CPU; 1 disables the pool)')
 
     args = parser.parse_args()
 
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+
+    if args.batch:
+        run_batch(args.batch, max_workers=args.jobs)
+        return
+
+    # Single-job mode: enforce the arguments that --batch made optional
+    missing = [flag for flag, value in (('--version', args.version),
+                                        ('--snapshot', args.snapshot),
+                                        ('--release-plan', args.release_plan),
+                                        ('--release-name', args.release_name),
+                                        ('--release-notes-template', args.release_notes_template))
+               if not value]
+    if missing:
+        parser.error(f"the following arguments are required: {', '.join(missing)}")
+
     if args.release_type == 'RHSA' and args.cves_file and args.component is None and args.cve_components is None:
         print("Error: --component or --cve-components is required for RHSA releases with a CVE file", file=sys.stderr)
         sys.exit(1)
@@ -248,22 +665,20 @@ def main():
         args.cve_components
     )
 
-    # Convert to YAML string
-    yaml_str = yaml.dump(prod_release, default_flow_style=False, sort_keys=False)
-
-    # Output
+    # Output - dump straight to the destination stream rather than building
+    # the full YAML document in memory first
     if args.output:
         output_dir = os.path.dirname(args.output)
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
         with open(args.output, 'w') as f:
-            f.write(yaml_str)
+            dump_release_yaml(prod_release, f, args.output_format)
         print(f"Generated: {args.output}", file=sys.stderr)
         print(f"  Release: {prod_release['metadata']['name']}", file=sys.stderr)
         print(f"  Release Plan: {prod_release['spec']['releasePlan']}", file=sys.stderr)
         print(f"  Snapshot: {prod_release['spec']['snapshot']}", file=sys.stderr)
     else:
-        print(yaml_str)
+        dump_release_yaml(prod_release, sys.stdout, args.output_format)
 
 
 if __name__ == '__main__':
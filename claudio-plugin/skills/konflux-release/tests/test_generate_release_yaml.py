@@ -1,9 +1,12 @@
+import io
+import json
 import sys
 import yaml
 import pytest
 
 from scripts.generate_release_yaml import (
     apply_template_substitutions,
+    dump_release_yaml,
     load_cves_from_file,
     load_release_notes_template,
     generate_prod_release_yaml,
@@ -54,6 +57,13 @@ class TestApplyTemplateSubstitutions:
     def test_empty_accelerator_substitutes_empty_string(self):
         assert apply_template_substitutions("{accelerator} {version}", "3.3.0", "") == " 3.3.0"
 
+    def test_substituted_value_is_not_rescanned(self):
+        # A literal '{accelerator}' inside the version value must survive,
+        # matching str.format semantics - no double substitution
+        result = apply_template_substitutions(
+            "{version} {accelerator}", "v{accelerator}1", "CUDA")
+        assert result == "v{accelerator}1 CUDA"
+
 
 # ── load_cves_from_file ────────────────────────────────────────────────────────
 
@@ -82,6 +92,12 @@ class TestLoadCvesFromFile:
         with pytest.raises(SystemExit):
             load_cves_from_file("/nonexistent/cves.txt")
 
+    def test_exits_on_malformed_entry(self, tmp_path):
+        f = tmp_path / "cves.txt"
+        f.write_text("CVE-2024-1234\nCVE-TYPO\n")
+        with pytest.raises(SystemExit):
+            load_cves_from_file(str(f))
+
 
 # ── load_release_notes_template ───────────────────────────────────────────────
 
@@ -232,6 +248,56 @@ class TestGenerateProdReleaseYaml:
         assert result["spec"]["releasePlan"] == "bootc-containers-full-prod"
 
 
+# ── dump_release_yaml ─────────────────────────────────────────────────────────
+
+class TestDumpReleaseYaml:
+    def _release(self, **metadata_overrides):
+        release = generate_prod_release_yaml(
+            component_name="my-comp",
+            version="3.3.0",
+            snapshot="snap-abc123",
+            release_plan="my-plan-prod",
+            release_name="my-comp-3-3-0-prod-1",
+            accelerator="CUDA",
+            namespace="my-namespace",
+            release_notes_template=RHAIIS_TEMPLATE.copy(),
+            release_type="RHEA",
+            cves_file=None,
+            grace_period=30,
+        )
+        release["metadata"].update(metadata_overrides)
+        return release
+
+    def test_round_trips_to_same_dict(self):
+        release = self._release()
+        buf = io.StringIO()
+        dump_release_yaml(release, buf)
+        assert yaml.safe_load(buf.getvalue()) == release
+
+    def test_json_format_round_trips(self):
+        release = self._release()
+        buf = io.StringIO()
+        dump_release_yaml(release, buf, fmt="json")
+        assert json.loads(buf.getvalue()) == release
+
+    def test_falls_back_for_scalars_needing_quoting(self):
+        # A name that would be misparsed as a plain scalar forces the
+        # full-dump fallback; output must still round-trip
+        release = self._release(name="release: with colon")
+        buf = io.StringIO()
+        dump_release_yaml(release, buf)
+        assert yaml.safe_load(buf.getvalue()) == release
+
+    @pytest.mark.parametrize("name", ["true", "null", "on", "NO", "123", "3.5"])
+    def test_scalars_resolving_to_other_types_stay_strings(self, name):
+        # Valid Kubernetes names that YAML would read back as bool/int/float
+        # when emitted plain - must round-trip as the original string
+        release = self._release(name=name)
+        buf = io.StringIO()
+        dump_release_yaml(release, buf)
+        assert yaml.safe_load(buf.getvalue())["metadata"]["name"] == name
+
+
 # ── main() / CLI ──────────────────────────────────────────────────────────────
 
 class TestMain:
@@ -302,3 +368,118 @@ class TestMain:
         monkeypatch.setattr(sys, "argv", ["prog", "--version", "3.3.0"])
         with pytest.raises(SystemExit):
             main()
+
+
+# ── --batch mode ──────────────────────────────────────────────────────────────
+
+class TestBatchMode:
+    def _write_batch(self, tmp_path, jobs):
+        tmpl = tmp_path / "template.yaml"
+        tmpl.write_text("synopsis: 'RHAIIS {version} ({accelerator})'\n")
+        for job in jobs:
+            job.setdefault("release_notes_template", str(tmpl))
+        batch = tmp_path / "jobs.yaml"
+        batch.write_text(yaml.dump(jobs))
+        return batch
+
+    def _job(self, tmp_path, name, **overrides):
+        job = dict(
+            version="3.3.0",
+            snapshot=f"snap-{name}",
+            release_plan=f"{name}-prod",
+            release_name=f"{name}-3-3-0-prod-1",
+            accelerator="CUDA",
+            output=str(tmp_path / "out" / f"{name}-prod-1.yaml"),
+        )
+        job.update(overrides)
+        return job
+
+    def test_batch_generates_all_outputs(self, tmp_path, monkeypatch):
+        jobs = [self._job(tmp_path, "comp-a"), self._job(tmp_path, "comp-b", accelerator="ROCm")]
+        batch = self._write_batch(tmp_path, jobs)
+        monkeypatch.setattr(sys, "argv", ["prog", "--batch", str(batch)])
+        main()
+        a = yaml.safe_load((tmp_path / "out" / "comp-a-prod-1.yaml").read_text())
+        b = yaml.safe_load((tmp_path / "out" / "comp-b-prod-1.yaml").read_text())
+        assert a["metadata"]["name"] == "comp-a-3-3-0-prod-1"
+        assert a["spec"]["data"]["releaseNotes"]["synopsis"] == "RHAIIS 3.3.0 (CUDA)"
+        assert b["spec"]["data"]["releaseNotes"]["synopsis"] == "RHAIIS 3.3.0 (ROCm)"
+
+    def test_batch_job_missing_key_fails_before_writing(self, tmp_path, monkeypatch):
+        good = self._job(tmp_path, "comp-a")
+        bad = self._job(tmp_path, "comp-b")
+        del bad["snapshot"]
+        batch = self._write_batch(tmp_path, [good, bad])
+        monkeypatch.setattr(sys, "argv", ["prog", "--batch", str(batch)])
+        with pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code != 0
+        # Validation happens up front - no partial batch output
+        assert not (tmp_path / "out").exists()
+
+    def test_batch_unquoted_version_fails_before_writing(self, tmp_path, monkeypatch):
+        # An unquoted `version: 3.3` arrives from YAML as a float - must be
+        # rejected up front, not crash mid-render
+        jobs = [self._job(tmp_path, "comp-a"), self._job(tmp_path, "comp-b", version=3.3)]
+        batch = self._write_batch(tmp_path, jobs)
+        monkeypatch.setattr(sys, "argv", ["prog", "--batch", str(batch)])
+        with pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code != 0
+        assert not (tmp_path / "out").exists()
+
+    def test_batch_non_integer_grace_period_fails_before_writing(self, tmp_path, monkeypatch):
+        jobs = [self._job(tmp_path, "comp-a", grace_period="thirty")]
+        batch = self._write_batch(tmp_path, jobs)
+        monkeypatch.setattr(sys, "argv", ["prog", "--batch", str(batch)])
+        with pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code != 0
+        assert not (tmp_path / "out").exists()
+
+    def test_batch_unknown_output_format_fails_before_writing(self, tmp_path, monkeypatch):
+        # A typo like 'jsn' must fail validation, not silently emit YAML
+        jobs = [self._job(tmp_path, "comp-a", output_format="jsn")]
+        batch = self._write_batch(tmp_path, jobs)
+        monkeypatch.setattr(sys, "argv", ["prog", "--batch", str(batch)])
+        with pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code != 0
+        assert not (tmp_path / "out").exists()
+
+    def test_batch_json_output_format(self, tmp_path, monkeypatch):
+        jobs = [self._job(tmp_path, "comp-a", output_format="json")]
+        batch = self._write_batch(tmp_path, jobs)
+        monkeypatch.setattr(sys, "argv", ["prog", "--batch", str(batch)])
+        main()
+        data = json.loads((tmp_path / "out" / "comp-a-prod-1.yaml").read_text())
+        assert data["metadata"]["name"] == "comp-a-3-3-0-prod-1"
+
+    def test_batch_serial_with_jobs_one(self, tmp_path, monkeypatch):
+        jobs = [self._job(tmp_path, "comp-a"), self._job(tmp_path, "comp-b")]
+        batch = self._write_batch(tmp_path, jobs)
+        monkeypatch.setattr(sys, "argv", ["prog", "--batch", str(batch), "--jobs", "1"])
+        main()
+        assert (tmp_path / "out" / "comp-a-prod-1.yaml").exists()
+        assert (tmp_path / "out" / "comp-b-prod-1.yaml").exists()
+
+    @pytest.mark.parametrize("jobs", ["0", "-2"])
+    def test_batch_non_positive_jobs_fails(self, tmp_path, monkeypatch, capsys, jobs):
+        batch = self._write_batch(tmp_path, [self._job(tmp_path, "comp-a")])
+        monkeypatch.setattr(sys, "argv", ["prog", "--batch", str(batch), "--jobs", jobs])
+        with pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code != 0
+        assert "--jobs" in capsys.readouterr().err
+
+    def test_batch_missing_file_fails(self, monkeypatch):
+        monkeypatch.setattr(sys, "argv", ["prog", "--batch", "/nonexistent/jobs.yaml"])
+        with pytest.raises(SystemExit):
+            main()
+
+    def test_batch_not_a_list_fails(self, tmp_path, monkeypatch):
+        batch = tmp_path / "jobs.yaml"
+        batch.write_text("version: 3.3.0\n")
+        monkeypatch.setattr(sys, "argv", ["prog", "--batch", str(batch)])
+        with pytest.raises(SystemExit):
+            main()